@@ -1,8 +1,9 @@
 from flask import Flask, request, jsonify
 import logging
-from config import OUTPUT_JSON_PATH, OUTPUT_CSV_PATH, LOG_FILE
+from config import OUTPUT_JSON_PATH, OUTPUT_CSV_PATH, OUTPUT_DEDUP_JSON_PATH, LOG_FILE
 from processing.data_loader import extract_entries
 from processing.data_processing import process_data
+from processing.deduplication import find_duplicate_entries, map_schedule_indexes
 from save_to_file import save_data
 from validation.validate_output import validate_data
 
@@ -45,10 +46,13 @@ def process_payload():
 
         valid_data = validate_data(structured_lease_data)
 
-        save_data(valid_data, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH)
+        find_duplicate_entries(valid_data, map_schedule_indexes(structured_lease_data, valid_data))
+
+        save_data(valid_data, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH, OUTPUT_DEDUP_JSON_PATH)
 
         app.logger.info(f"Data has been processed and saved to: {OUTPUT_JSON_PATH}")
         app.logger.info(f"Data has been processed and saved to: {OUTPUT_CSV_PATH}")
+        app.logger.info(f"Data has been processed and saved to: {OUTPUT_DEDUP_JSON_PATH}")
 
         return jsonify(valid_data), 200
 
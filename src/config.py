@@ -12,6 +12,10 @@ OUTPUT_DIR = os.path.join(DATA_DIR, 'output')
 INPUT_JSON_PATH = os.path.join(INPUT_DIR, 'schedule_of_notices_of_lease_examples.json')
 OUTPUT_CSV_PATH = os.path.join(OUTPUT_DIR, 'structured_lease_data.csv')
 OUTPUT_JSON_PATH = os.path.join(OUTPUT_DIR, 'structured_lease_data.json')
+OUTPUT_DEDUP_JSON_PATH = os.path.join(OUTPUT_DIR, 'structured_lease_data.dedup.json')
+
+# Shared work-queue directory for distributed runs (see distributed.py)
+WORK_QUEUE_DIR = os.path.join(DATA_DIR, 'work_queue')
 
 # Log directory and file
 LOG_DIR = os.path.join(BASE_DIR, '..', 'lease-parser', 'logs')
@@ -0,0 +1,95 @@
+import argparse
+import logging
+import os
+import socket
+import sys
+
+from config import INPUT_JSON_PATH, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH, OUTPUT_DEDUP_JSON_PATH, WORK_QUEUE_DIR
+from processing.data_loader import load_json_data, extract_entries
+from processing.deduplication import find_duplicate_entries
+from processing.work_queue import (create_work_units, run_worker, merge_partial_outputs, DEFAULT_LEASE_TIMEOUT,
+                                   DEFAULT_MAX_ATTEMPTS)
+from save_to_file import save_data
+
+# Set up basic logging configuration
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def coordinate(args: argparse.Namespace) -> bool:
+    data = load_json_data(args.input)
+
+    if data is None:
+        logging.error("Failed to load data. Exiting.")
+        return False
+
+    if extract_entries(data) is None:
+        logging.error("Failed to extract entries. Exiting.")
+        return False
+
+    return create_work_units(data, args.queue_dir, args.schedules_per_unit) is not None
+
+
+def work(args: argparse.Namespace) -> bool:
+    _, exhausted = run_worker(args.queue_dir, args.worker_id, args.lease_timeout, args.max_attempts,
+                              args.poll_interval)
+    return not exhausted
+
+
+def merge(args: argparse.Namespace) -> bool:
+    merged = merge_partial_outputs(args.queue_dir)
+
+    if merged is None:
+        logging.error("Failed to merge partial outputs. Exiting.")
+        return False
+
+    valid_data, schedule_indexes = merged
+
+    # Duplicates can span units, so they are only detectable once all partial outputs are merged
+    find_duplicate_entries(valid_data, schedule_indexes)
+
+    save_data(valid_data, args.output_csv, args.output_json, args.output_dedup_json)
+
+    logging.info(f"Data has been processed and saved to: {args.output_json}")
+    logging.info(f"Data has been processed and saved to: {args.output_csv}")
+    logging.info(f"Data has been processed and saved to: {args.output_dedup_json}")
+    return True
+
+
+def main():
+    """
+    Distributed processing over a shared work-queue directory. Run 'coordinate' once to split the input into
+    work units, 'work' on any number of nodes sharing the directory, then 'merge' to write the usual outputs.
+    Each command exits with status 1 on failure so that batch schedulers can detect it.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--queue-dir', default=WORK_QUEUE_DIR, help='Shared work-queue directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    coordinate_parser = subparsers.add_parser('coordinate', help='Split the input into work units')
+    coordinate_parser.add_argument('--input', default=INPUT_JSON_PATH)
+    coordinate_parser.add_argument('--schedules-per-unit', type=int, default=10)
+    coordinate_parser.set_defaults(func=coordinate)
+
+    work_parser = subparsers.add_parser('work', help='Claim and process work units until none are left')
+    work_parser.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}")
+    work_parser.add_argument('--lease-timeout', type=float, default=DEFAULT_LEASE_TIMEOUT)
+    work_parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS)
+    work_parser.add_argument('--poll-interval', type=float, default=5.0)
+    work_parser.set_defaults(func=work)
+
+    merge_parser = subparsers.add_parser('merge', help='Assemble the partial outputs into CSV and JSON files')
+    merge_parser.add_argument('--output-csv', default=OUTPUT_CSV_PATH)
+    merge_parser.add_argument('--output-json', default=OUTPUT_JSON_PATH)
+    merge_parser.add_argument('--output-dedup-json', default=OUTPUT_DEDUP_JSON_PATH)
+    merge_parser.set_defaults(func=merge)
+
+    args = parser.parse_args()
+    if not args.func(args):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
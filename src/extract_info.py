@@ -2,6 +2,8 @@ import logging
 import re
 from typing import List, Dict, Optional, Tuple
 
+from utils.utils import ValueInterner
+
 
 def initialize_empty_columns_and_notes() -> Tuple[Dict[str, List[str]], Dict[str, Optional[str]]]:
     """
@@ -123,11 +125,14 @@ def parse_notes_into_dictionary(note_lines: List[str], notes: Dict[str, Optional
     return notes
 
 
-def construct_result(columns: Dict[str, List[str]], notes: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+def construct_result(columns: Dict[str, List[str]], notes: Dict[str, Optional[str]],
+                     interner: Optional[ValueInterner] = None) -> Dict[str, Optional[str]]:
     """
     Construct the final result dictionary combining columns and notes.
+    Values are shared through the interner when given. Only whole field values are shared, so a lease term such
+    as '125 years from' inside dateOfLeaseAndTermAsReported is not shared with other entries.
     """
-    return {
+    result = {
         "registrationDateAndPlanRef": ' '.join(columns['registrationDateAndPlanRef']).strip() or None,
         "propertyDescription": ' '.join(columns['propertyDescription']).strip() or None,
         "dateOfLeaseAndTermAsReported": ' '.join(columns['dateOfLeaseAndTermAsReported']).strip() or None,
@@ -137,22 +142,27 @@ def construct_result(columns: Dict[str, List[str]], notes: Dict[str, Optional[st
         "noteThree": notes.get('noteThree').strip() if notes.get('noteThree') else None,
         "noteFour": notes.get('noteFour').strip() if notes.get('noteFour') else None,
     }
+    if interner is None:
+        return result
+    return {key: interner.intern(value) for key, value in result.items()}
 
 
-def parse_entry_text_into_structured_data(entry_text: Optional[List[str]]) -> Dict[str, Optional[str]]:
+def parse_entry_text_into_structured_data(entry_text: Optional[List[str]],
+                                          interner: Optional[ValueInterner] = None) -> Dict[str, Optional[str]]:
     """
     Main function to parse entry text into structured columns and notes.
 
     :param entry_text: List of entry text lines.
+    :param interner: Optional interner shared across the run to deduplicate repeated values.
     :return: A dictionary containing structured columns and notes.
     """
     if entry_text is None:
         logging.warning("entryText is None, skipping this entry.")
         columns, notes = initialize_empty_columns_and_notes()
-        return construct_result(columns, notes)
+        return construct_result(columns, notes, interner)
 
     columns, notes = initialize_empty_columns_and_notes()
     main_text, note_lines = separate_main_text_and_notes(entry_text)
     columns = parse_main_text_into_columns(main_text, columns)
     notes = parse_notes_into_dictionary(note_lines, notes)
-    return construct_result(columns, notes)
+    return construct_result(columns, notes, interner)
@@ -1,8 +1,9 @@
 import logging
 
-from config import INPUT_JSON_PATH, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH
+from config import INPUT_JSON_PATH, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH, OUTPUT_DEDUP_JSON_PATH
 from processing.data_loader import load_json_data, extract_entries
 from processing.data_processing import process_data
+from processing.deduplication import find_duplicate_entries, map_schedule_indexes
 from save_to_file import save_data
 from validation.validate_output import validate_data
 
@@ -33,10 +34,14 @@ def main():
     # Validate data
     valid_data = validate_data(structured_data)
 
-    save_data(valid_data, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH)
+    # Report entries registered with identical content, e.g. under several schedules
+    find_duplicate_entries(valid_data, map_schedule_indexes(structured_data, valid_data))
+
+    save_data(valid_data, OUTPUT_CSV_PATH, OUTPUT_JSON_PATH, OUTPUT_DEDUP_JSON_PATH)
 
     logging.info(f"Data has been processed and saved to: {OUTPUT_JSON_PATH}")
     logging.info(f"Data has been processed and saved to: {OUTPUT_CSV_PATH}")
+    logging.info(f"Data has been processed and saved to: {OUTPUT_DEDUP_JSON_PATH}")
 
 
 if __name__ == '__main__':
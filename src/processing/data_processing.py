@@ -1,32 +1,34 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from extract_info import parse_entry_text_into_structured_data
-from utils.utils import generate_guid, update_date_time
+from utils.utils import generate_guid, update_date_time, ValueInterner
 
 
-def process_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def process_entries(entries: List[Dict[str, Any]], interner: Optional[ValueInterner] = None) -> List[Dict[str, Any]]:
     """
     Process each entry by extracting its text, splitting it into columns, and
     adding unique identifiers and timestamps.
 
     :param entries: A list of dictionaries containing the raw entry data.
+    :param interner: Optional interner shared across the run to deduplicate repeated values.
     :return: A list of dictionaries with processed entry data, including GUIDs and timestamps.
     """
     results = []
+    interner = interner if interner is not None else ValueInterner()
 
     for entry in entries:
         # Extract entry text; default to an empty list if not present
         entry_text = entry.get('entryText', [])
 
         # Split entry text into structured columns (e.g., registration date, property description, etc..)
-        split_result = parse_entry_text_into_structured_data(entry_text)
+        split_result = parse_entry_text_into_structured_data(entry_text, interner)
 
         # Append processed data with a unique GUID and timestamp for traceability since there are so many entries
         results.append({
             "guid": generate_guid(),
-            "processedDateTime": update_date_time(),
-            "entryNumber": entry.get('entryNumber', None),
+            "processedDateTime": interner.intern(update_date_time()),
+            "entryNumber": interner.intern(entry.get('entryNumber', None)),
             **split_result  # Unpack split column data into the dictionary
         })
 
@@ -42,16 +44,17 @@ def process_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     :return: A list of dictionaries with the processed data, maintaining the original hierarchy.
     """
     processed_data = []
+    interner = ValueInterner()  # Scoped to this run so repeated values are shared but released afterwards
 
     for item in data:
         if 'leaseschedule' in item and 'scheduleEntry' in item['leaseschedule']:
             # Process entries within each leaseschedule
-            processed_entries = process_entries(item['leaseschedule']['scheduleEntry'])
+            processed_entries = process_entries(item['leaseschedule']['scheduleEntry'], interner)
 
             # Reconstruct the leaseschedule with processed entries to retain the structure
             processed_schedule = {
                 "leaseschedule": {
-                    "scheduleType": item['leaseschedule'].get('scheduleType', 'Unknown Schedule Type'),
+                    "scheduleType": interner.intern(item['leaseschedule'].get('scheduleType', 'Unknown Schedule Type')),
                     "scheduleEntry": processed_entries
                 }
             }
@@ -59,5 +62,5 @@ def process_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             # Append the processed schedule to the final data
             processed_data.append(processed_schedule)
 
-    logging.info("Processing completed, retaining original data structure.")
+    logging.info(f"Processing completed, retaining original data structure. Distinct values: {len(interner)}")
     return processed_data
@@ -0,0 +1,157 @@
+import logging
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+# Fields that make up the parsed content of an entry. guid, processedDateTime and entryNumber are
+# per-registration metadata, so two entries with equal content fields are considered duplicates.
+CONTENT_FIELDS = [
+    "registrationDateAndPlanRef", "propertyDescription", "dateOfLeaseAndTermAsReported", "lesseesTitle",
+    "noteOne", "noteTwo", "noteThree", "noteFour"
+]
+
+# Cancelled items keep only a short stub such as 'ITEM CANCELLED on 6 August 2019.', which repeats
+# legitimately within a schedule and says nothing about the lease itself.
+CANCELLATION_PATTERN = re.compile(r'^(ITEM|ENTRY) CANCELLED\b', re.IGNORECASE)
+
+
+def entry_content_key(entry: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    """
+    Build a hashable key from the parsed content of an entry.
+
+    :param entry: A dictionary containing a single processed entry.
+    :return: A tuple of the entry's content field values.
+    """
+    return tuple(entry.get(field) for field in CONTENT_FIELDS)
+
+
+def is_cancellation_stub(entry: Dict[str, Any]) -> bool:
+    """Check whether an entry only records the cancellation of an item."""
+    registration = entry.get("registrationDateAndPlanRef")
+    return isinstance(registration, str) and bool(CANCELLATION_PATTERN.match(registration))
+
+
+def map_schedule_indexes(structured_lease_data: List[Dict[str, Any]], entries: List[Dict[str, Any]]) -> List[int]:
+    """
+    Find the index of the schedule each entry belongs to, as the flat validated list no longer records it.
+
+    :param structured_lease_data: A list of dictionaries containing the structured lease data with nested scheduleEntries.
+    :param entries: A list of entries taken from structured_lease_data, such as the output of validate_data.
+    :return: The schedule index of each entry, in the order of entries.
+    """
+    schedule_index_by_guid = {}
+    for schedule_idx, item in enumerate(structured_lease_data):
+        if 'leaseschedule' in item and 'scheduleEntry' in item['leaseschedule']:
+            for entry in item['leaseschedule']['scheduleEntry']:
+                schedule_index_by_guid[entry.get("guid")] = schedule_idx
+    return [schedule_index_by_guid[entry.get("guid")] for entry in entries]
+
+
+def find_duplicate_entries(entries: List[Dict[str, Any]], schedule_indexes: List[int]) -> List[List[Dict[str, Any]]]:
+    """
+    Detect entries with identical content, within a schedule or registered under several schedules.
+    Cancellation stubs and entries without any content are excluded, as they repeat without being duplicates.
+    Each group is logged with the location of its occurrences.
+
+    :param entries: A list of dictionaries containing validated entries.
+    :param schedule_indexes: The schedule index of each entry, see map_schedule_indexes.
+    :return: A list of duplicate groups, each listing the scheduleIndex, entryNumber and guid of every occurrence.
+    """
+    groups: Dict[Tuple[Optional[str], ...], List[Dict[str, Any]]] = {}
+    cancellation_stubs = 0
+    empty_entries = 0
+
+    for entry, schedule_idx in zip(entries, schedule_indexes):
+        key = entry_content_key(entry)
+        if all(value is None for value in key):
+            empty_entries += 1
+            continue
+        if is_cancellation_stub(entry):
+            cancellation_stubs += 1
+            continue
+        groups.setdefault(key, []).append({
+            "scheduleIndex": schedule_idx,
+            "entryNumber": entry.get("entryNumber"),
+            "guid": entry.get("guid")
+        })
+
+    duplicates = [group for group in groups.values() if len(group) > 1]
+    spanning = sum(1 for group in duplicates if len({occurrence["scheduleIndex"] for occurrence in group}) > 1)
+    logging.info(f"Duplicate entry groups found: {len(duplicates)} ({spanning} spanning several schedules, "
+                 f"{sum(len(group) - 1 for group in duplicates)} redundant entries). "
+                 f"Excluded {cancellation_stubs} cancellation stubs and {empty_entries} empty entries")
+    for group in duplicates:
+        locations = ', '.join(f"schedule {occurrence['scheduleIndex']} entry {occurrence['entryNumber']}"
+                              for occurrence in group)
+        logging.info(f"Duplicate entry content at {locations}")
+    return duplicates
+
+
+def deduplicate_entries(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a flat list of entries into a deduplicated structure where every distinct string is stored once
+    in 'values' and every distinct entry content is stored once in 'contents'. Entries reference both by index.
+
+    :param entries: A list of dictionaries containing processed entries.
+    :return: A dictionary with 'values', 'contentFields', 'contents' and 'entries' tables.
+    """
+    values: List[str] = []
+    value_index: Dict[str, int] = {}
+    contents: List[List[Optional[int]]] = []
+    content_index: Dict[Tuple[Optional[str], ...], int] = {}
+
+    def value_ref(value: Optional[str]) -> Optional[int]:
+        # None is kept as-is so that missing values remain distinguishable from empty strings
+        if value is None:
+            return None
+        if value not in value_index:
+            value_index[value] = len(values)
+            values.append(value)
+        return value_index[value]
+
+    deduplicated_entries = []
+    for entry in entries:
+        key = entry_content_key(entry)
+        if key not in content_index:
+            content_index[key] = len(contents)
+            contents.append([value_ref(value) for value in key])
+
+        deduplicated_entries.append({
+            "guid": entry.get("guid"),
+            "processedDateTime": value_ref(entry.get("processedDateTime")),
+            "entryNumber": value_ref(entry.get("entryNumber")),
+            "content": content_index[key]
+        })
+
+    logging.info(f"Deduplicated {len(entries)} entries into {len(contents)} distinct contents "
+                 f"and {len(values)} distinct values")
+    return {
+        "values": values,
+        "contentFields": CONTENT_FIELDS,
+        "contents": contents,
+        "entries": deduplicated_entries
+    }
+
+
+def expand_deduplicated_entries(deduplicated_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Rebuild the flat list of entries from the output of deduplicate_entries.
+
+    :param deduplicated_data: A dictionary with 'values', 'contentFields', 'contents' and 'entries' tables.
+    :return: A list of dictionaries with the original entry data.
+    """
+    values = deduplicated_data["values"]
+    fields = deduplicated_data["contentFields"]
+
+    def resolve(ref: Optional[int]) -> Optional[str]:
+        return values[ref] if ref is not None else None
+
+    entries = []
+    for entry in deduplicated_data["entries"]:
+        content = deduplicated_data["contents"][entry["content"]]
+        entries.append({
+            "guid": entry["guid"],
+            "processedDateTime": resolve(entry["processedDateTime"]),
+            "entryNumber": resolve(entry["entryNumber"]),
+            **{field: resolve(ref) for field, ref in zip(fields, content)}
+        })
+    return entries
@@ -0,0 +1,357 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from processing.data_processing import process_data
+from processing.deduplication import map_schedule_indexes
+from validation.validate_output import validate_data
+
+# Layout of the shared work-queue directory. Only plain files are used so that any shared filesystem will do.
+#   manifest.json                   unit and schedule counts, written by the coordinator after all units
+#   units/unit-00000.json           schedules assigned to the unit, written by the coordinator
+#   leases/unit-00000/1             claim of a worker on the unit, one file per attempt
+#   partial/unit-00000.json         valid entries produced by the worker, with their schedule indexes
+#   done/unit-00000.done            marker written once the partial output is in place
+MANIFEST_FILE = 'manifest.json'
+UNITS_DIR = 'units'
+LEASES_DIR = 'leases'
+PARTIAL_DIR = 'partial'
+DONE_DIR = 'done'
+
+DEFAULT_LEASE_TIMEOUT = 300  # Seconds without a heartbeat after which a lease is considered abandoned
+DEFAULT_MAX_ATTEMPTS = 3  # Units failing this many times are left for inspection rather than retried forever
+
+
+def write_json_atomically(path: str, data: Any) -> None:
+    """
+    Write JSON to a temporary file and move it into place so readers never see a partial file.
+
+    :param path: The final file path.
+    :param data: The data to serialise.
+    """
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"  # PIDs are not unique across nodes sharing the directory
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+    os.replace(tmp_path, path)
+
+
+def unit_id_for(index: int) -> str:
+    """Return the id of the unit at the given index."""
+    return f"unit-{index:05d}"
+
+
+def read_manifest(queue_dir: str) -> Optional[Dict[str, Any]]:
+    """Read the manifest, or return None if the coordinator has not finished writing the queue."""
+    try:
+        with open(os.path.join(queue_dir, MANIFEST_FILE), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def list_unit_ids(queue_dir: str) -> List[str]:
+    """List the ids of all units written by the coordinator so far, in order."""
+    units_path = os.path.join(queue_dir, UNITS_DIR)
+    if not os.path.isdir(units_path):
+        return []
+    return sorted(name[:-len('.json')] for name in os.listdir(units_path) if name.endswith('.json'))
+
+
+def list_done_unit_ids(queue_dir: str) -> Set[str]:
+    """List the ids of all completed units."""
+    done_path = os.path.join(queue_dir, DONE_DIR)
+    if not os.path.isdir(done_path):
+        return set()
+    return {name[:-len('.done')] for name in os.listdir(done_path) if name.endswith('.done')}
+
+
+def is_unit_done(queue_dir: str, unit_id: str) -> bool:
+    """Check whether a unit has been completed."""
+    return os.path.exists(os.path.join(queue_dir, DONE_DIR, f"{unit_id}.done"))
+
+
+def create_work_units(data: List[Dict[str, Any]], queue_dir: str, schedules_per_unit: int) -> Optional[List[str]]:
+    """
+    Split the input data into ranges of schedules and write each range as a work unit. The manifest is
+    written last, so its presence means the queue is complete.
+
+    :param data: A list of dictionaries representing the full input data structure.
+    :param queue_dir: The shared work-queue directory.
+    :param schedules_per_unit: The number of schedules assigned to each unit.
+    :return: The ids of the units written, or None if the queue could not be created.
+    """
+    if schedules_per_unit < 1:
+        logging.error(f"schedules_per_unit must be positive, got {schedules_per_unit}")
+        return None
+    if list_unit_ids(queue_dir) or read_manifest(queue_dir) is not None:
+        logging.error(f"Work queue {queue_dir} already contains units. Use an empty directory.")
+        return None
+
+    for sub_dir in (UNITS_DIR, LEASES_DIR, PARTIAL_DIR, DONE_DIR):
+        os.makedirs(os.path.join(queue_dir, sub_dir), exist_ok=True)
+
+    unit_ids = []
+    for start in range(0, len(data), schedules_per_unit):
+        unit_id = unit_id_for(len(unit_ids))
+        schedules = data[start:start + schedules_per_unit]
+        os.makedirs(os.path.join(queue_dir, LEASES_DIR, unit_id), exist_ok=True)
+        write_json_atomically(os.path.join(queue_dir, UNITS_DIR, f"{unit_id}.json"), {
+            "unitId": unit_id,
+            "scheduleStart": start,
+            "scheduleEnd": start + len(schedules),
+            "data": schedules
+        })
+        unit_ids.append(unit_id)
+
+    write_json_atomically(os.path.join(queue_dir, MANIFEST_FILE), {
+        "unitCount": len(unit_ids),
+        "scheduleCount": len(data),
+        "schedulesPerUnit": schedules_per_unit
+    })
+
+    logging.info(f"Created {len(unit_ids)} work units in {queue_dir}")
+    return unit_ids
+
+
+def filesystem_time(queue_dir: str) -> float:
+    """
+    Return the current time according to the shared filesystem, read from the mtime of a freshly written probe
+    file. Lease mtimes are set by the same filesystem, so lease ages do not depend on node clocks agreeing.
+    """
+    probe_path = os.path.join(queue_dir, f".clock-{uuid.uuid4().hex}")
+    with open(probe_path, 'w', encoding='utf-8'):
+        pass
+    try:
+        return os.path.getmtime(probe_path)
+    finally:
+        os.remove(probe_path)
+
+
+def lease_path(queue_dir: str, unit_id: str, attempt: int) -> str:
+    """Return the path of the lease file for a given attempt on a unit."""
+    return os.path.join(queue_dir, LEASES_DIR, unit_id, str(attempt))
+
+
+def get_lease_attempts(queue_dir: str, unit_id: str) -> List[int]:
+    """Return the attempt numbers of all leases taken on a unit, in ascending order."""
+    try:
+        names = os.listdir(os.path.join(queue_dir, LEASES_DIR, unit_id))
+    except FileNotFoundError:
+        return []
+    return sorted(int(name) for name in names if name.isdigit())
+
+
+def try_claim_unit(queue_dir: str, unit_id: str, worker_id: str, lease_timeout: float,
+                   max_attempts: int, now: Optional[float] = None) -> Optional[int]:
+    """
+    Try to claim a unit by creating the next lease file for it. Creating a file with O_EXCL is atomic, so
+    when several workers race for the same attempt number only one of them wins. A unit whose latest lease
+    has not been renewed within lease_timeout is reclaimed by taking the next attempt number. Lease ages are
+    measured against now, which defaults to the filesystem time.
+
+    :return: The attempt number of the lease taken, or None if the unit could not be claimed.
+    """
+    if is_unit_done(queue_dir, unit_id):
+        return None
+
+    attempts = get_lease_attempts(queue_dir, unit_id)
+    if attempts:
+        try:
+            last_heartbeat = os.path.getmtime(lease_path(queue_dir, unit_id, attempts[-1]))
+        except FileNotFoundError:
+            return None
+        now = now if now is not None else filesystem_time(queue_dir)
+        if now - last_heartbeat < lease_timeout:
+            return None  # Still held by a live worker
+        if attempts[-1] >= max_attempts:
+            return None
+        logging.warning(f"Lease on {unit_id} (attempt {attempts[-1]}) expired, reclaiming")
+
+    attempt = attempts[-1] + 1 if attempts else 1
+    try:
+        fd = os.open(lease_path(queue_dir, unit_id, attempt), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return None  # Another worker claimed it first
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        json.dump({"workerId": worker_id, "claimedAt": time.time()}, file)
+    return attempt
+
+
+def is_unit_exhausted(queue_dir: str, unit_id: str, lease_timeout: float, max_attempts: int,
+                      now: Optional[float] = None) -> bool:
+    """Check whether a unit has expired on its final attempt and will not be claimed again."""
+    attempts = get_lease_attempts(queue_dir, unit_id)
+    if not attempts or attempts[-1] < max_attempts:
+        return False
+    try:
+        last_heartbeat = os.path.getmtime(lease_path(queue_dir, unit_id, attempts[-1]))
+    except FileNotFoundError:
+        return False
+    now = now if now is not None else filesystem_time(queue_dir)
+    return now - last_heartbeat >= lease_timeout
+
+
+def renew_lease(queue_dir: str, unit_id: str, attempt: int) -> bool:
+    """
+    Touch the lease file to signal the worker is alive, and check the lease has not been superseded.
+
+    :return: True if the lease is still the latest one held on the unit, False otherwise.
+    """
+    try:
+        os.utime(lease_path(queue_dir, unit_id, attempt))
+    except FileNotFoundError:
+        return False
+    return get_lease_attempts(queue_dir, unit_id)[-1] == attempt
+
+
+class LeaseHeartbeat:
+    """
+    Context manager renewing a lease from a background thread while a unit is processed, so that a live
+    worker is not reclaimed when a unit takes longer than the lease timeout.
+    """
+
+    def __init__(self, queue_dir: str, unit_id: str, attempt: int, interval: float):
+        self.queue_dir = queue_dir
+        self.unit_id = unit_id
+        self.attempt = attempt
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if not renew_lease(self.queue_dir, self.unit_id, self.attempt):
+                logging.warning(f"Lease on {self.unit_id} (attempt {self.attempt}) was superseded")
+                return
+
+    def __enter__(self) -> 'LeaseHeartbeat':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+def process_unit(queue_dir: str, unit_id: str, attempt: int, lease_timeout: float = DEFAULT_LEASE_TIMEOUT) -> bool:
+    """
+    Run the usual processing and validation on a claimed unit, then write its partial output and done marker.
+    The lease is renewed in the background every third of lease_timeout while the unit is processed.
+
+    :return: True if the unit was completed by this worker, False otherwise.
+    """
+    with LeaseHeartbeat(queue_dir, unit_id, attempt, lease_timeout / 3):
+        with open(os.path.join(queue_dir, UNITS_DIR, f"{unit_id}.json"), 'r', encoding='utf-8') as file:
+            unit = json.load(file)
+
+        structured_data = process_data(unit['data'])
+        valid_data = validate_data(structured_data)
+
+    if not renew_lease(queue_dir, unit_id, attempt):
+        logging.warning(f"Lease on {unit_id} (attempt {attempt}) was reclaimed by another worker, discarding")
+        return False
+
+    schedule_indexes = [unit['scheduleStart'] + idx for idx in map_schedule_indexes(structured_data, valid_data)]
+    write_json_atomically(os.path.join(queue_dir, PARTIAL_DIR, f"{unit_id}.json"), {
+        "entries": valid_data,
+        "scheduleIndexes": schedule_indexes
+    })
+    write_json_atomically(os.path.join(queue_dir, DONE_DIR, f"{unit_id}.done"), {"attempt": attempt})
+    logging.info(f"Completed {unit_id} (schedules {unit['scheduleStart']}-{unit['scheduleEnd'] - 1})")
+    return True
+
+
+def run_worker(queue_dir: str, worker_id: str, lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS, poll_interval: float = 5.0) -> Tuple[int, List[str]]:
+    """
+    Claim and process units until every unit listed in the manifest is done or has used up its attempts.
+    Units already written are processed while the coordinator is still running, but the queue is only
+    considered drained once the manifest exists. While units are held by other workers, poll so that units
+    of workers that died can be reclaimed once their lease expires. A unit that fails has its lease released
+    straight away so that the next attempt does not wait for the lease to expire.
+
+    :param queue_dir: The shared work-queue directory.
+    :param worker_id: An identifier for this worker, recorded in its lease files.
+    :param lease_timeout: Seconds after which a lease without a heartbeat may be reclaimed.
+    :param max_attempts: The maximum number of leases taken on a unit.
+    :param poll_interval: Seconds to wait between scans when no unit can be claimed.
+    :return: The number of units completed by this worker and the ids of units that used up their attempts.
+    """
+    completed = 0
+    exhausted = []
+    os.makedirs(queue_dir, exist_ok=True)  # The coordinator may not have created the queue yet
+
+    while True:
+        manifest = read_manifest(queue_dir)
+        if manifest is not None:
+            unit_ids = [unit_id_for(idx) for idx in range(manifest['unitCount'])]
+        else:
+            unit_ids = list_unit_ids(queue_dir)
+
+        done = list_done_unit_ids(queue_dir)
+        pending = [unit_id for unit_id in unit_ids if unit_id not in done]
+        if manifest is not None and not pending:
+            break
+
+        claimed_any = False
+        now = filesystem_time(queue_dir)
+        for unit_id in pending:
+            attempt = try_claim_unit(queue_dir, unit_id, worker_id, lease_timeout, max_attempts, now)
+            if attempt is None:
+                continue
+            claimed_any = True
+            try:
+                if process_unit(queue_dir, unit_id, attempt, lease_timeout):
+                    completed += 1
+            except Exception as e:
+                logging.error(f"Worker {worker_id} failed on {unit_id} (attempt {attempt}): {e}")
+                os.utime(lease_path(queue_dir, unit_id, attempt), (0, 0))  # Release the lease for the next attempt
+            now = filesystem_time(queue_dir)  # Processing may have taken a while
+
+        if not claimed_any:
+            if manifest is not None and all(is_unit_exhausted(queue_dir, unit_id, lease_timeout, max_attempts, now)
+                                            for unit_id in pending):
+                exhausted = pending
+                logging.error(f"Units failed after {max_attempts} attempts: {', '.join(exhausted)}")
+                break
+            time.sleep(poll_interval)
+
+    logging.info(f"Worker {worker_id} finished, completed {completed} units")
+    return completed, exhausted
+
+
+def merge_partial_outputs(queue_dir: str) -> Optional[Tuple[List[Dict[str, Any]], List[int]]]:
+    """
+    Concatenate the partial outputs of all units in unit order.
+
+    :param queue_dir: The shared work-queue directory.
+    :return: The combined list of valid entries and the schedule index of each entry in the input,
+             or None if the queue is incomplete or any unit is not done yet.
+    """
+    manifest = read_manifest(queue_dir)
+    if manifest is None:
+        logging.error(f"No manifest found in {queue_dir}, the coordinator has not finished writing the queue")
+        return None
+
+    unit_ids = [unit_id_for(idx) for idx in range(manifest['unitCount'])]
+    done = list_done_unit_ids(queue_dir)
+    missing = [unit_id for unit_id in unit_ids if unit_id not in done]
+    if missing:
+        logging.error(f"Cannot merge, {len(missing)} of {len(unit_ids)} units are not done: {', '.join(missing)}")
+        return None
+
+    merged_data = []
+    schedule_indexes = []
+    for unit_id in unit_ids:
+        with open(os.path.join(queue_dir, PARTIAL_DIR, f"{unit_id}.json"), 'r', encoding='utf-8') as file:
+            partial = json.load(file)
+        merged_data.extend(partial['entries'])
+        schedule_indexes.extend(partial['scheduleIndexes'])
+
+    logging.info(f"Merged {len(merged_data)} entries from {len(unit_ids)} units "
+                 f"covering {manifest['scheduleCount']} schedules")
+    return merged_data, schedule_indexes
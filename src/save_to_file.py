@@ -1,7 +1,9 @@
 import csv
 import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from processing.deduplication import deduplicate_entries
 
 
 def flatten_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -67,16 +69,36 @@ def save_to_json(data: List[Dict[str, Any]], json_file_path: str) -> None:
         logging.error(f"Error saving data to JSON: {e}")
 
 
-def save_data(structured_lease_data: List[Dict[str, Any]], output_path_csv: str, output_path_json: str) -> None:
+def save_to_deduplicated_json(data: List[Dict[str, Any]], json_file_path: str) -> None:
+    """
+    Save the structured data to a JSON file in which repeated values and duplicate entries are stored once
+    and referenced by index. See processing.deduplication.deduplicate_entries for the layout.
+
+    :param data: A list of dictionaries containing the structured lease data.
+    :param json_file_path: The file path where the JSON will be saved.
+    """
+    try:
+        with open(json_file_path, 'w', encoding='utf-8') as jsonfile:
+            json.dump(deduplicate_entries(data), jsonfile, separators=(',', ':'))  # Compact, size is the point here
+        logging.info(f"Data successfully saved to {json_file_path}")
+    except Exception as e:
+        logging.error(f"Error saving data to deduplicated JSON: {e}")
+
+
+def save_data(structured_lease_data: List[Dict[str, Any]], output_path_csv: str, output_path_json: str,
+              output_path_dedup_json: Optional[str] = None) -> None:
     """
-    Save the structured data to both CSV and JSON files.
+    Save the structured data to both CSV and JSON files, and optionally to a deduplicated JSON file.
 
     :param structured_lease_data: A list of dictionaries containing the structured lease data.
     :param output_path_csv: The file path where the CSV will be saved.
     :param output_path_json: The file path where the JSON will be saved.
+    :param output_path_dedup_json: The file path where the deduplicated JSON will be saved, skipped if None.
     """
     try:
         save_to_csv(structured_lease_data, output_path_csv)
         save_to_json(structured_lease_data, output_path_json)
+        if output_path_dedup_json is not None:
+            save_to_deduplicated_json(structured_lease_data, output_path_dedup_json)
     except Exception as e:
         logging.error(f"Failed to save data: {e}")
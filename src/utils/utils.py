@@ -10,3 +10,22 @@ def generate_guid():
 def update_date_time():
     """Generate a datetime for each row."""
     return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class ValueInterner:
+    """
+    Share repeated string values within a single run. Unlike sys.intern, the values are released together
+    with the interner once the run ends, so long-running processes do not accumulate every value seen.
+    """
+
+    def __init__(self):
+        self._values = {}
+
+    def intern(self, value):
+        """Return the shared copy of a string value; other values are returned unchanged."""
+        if isinstance(value, str):
+            return self._values.setdefault(value, value)
+        return value
+
+    def __len__(self):
+        return len(self._values)
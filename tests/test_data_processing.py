@@ -0,0 +1,24 @@
+from typing import List, Dict, Any
+from processing.data_processing import process_data
+
+
+def test_process_data_shares_repeated_values() -> None:
+    """
+    Test that equal values parsed from different entries and schedules share a single string object.
+    """
+    entry_text: List[str] = [
+        "28.01.2009      Transformer Chamber (Ground   23.01.2009      EGL551039  ",
+        "tinted blue     Floor)                        99 years from              ",
+        "(part of)                                     23.1.2009"
+    ]
+    sample_data: List[Dict[str, Any]] = [
+        {"leaseschedule": {"scheduleType": "Test", "scheduleEntry": [{"entryNumber": "1", "entryText": entry_text}]}},
+        {"leaseschedule": {"scheduleType": "Test", "scheduleEntry": [{"entryNumber": "1", "entryText": entry_text}]}}
+    ]
+
+    result: List[Dict[str, Any]] = process_data(sample_data)
+    first: Dict[str, Any] = result[0]["leaseschedule"]["scheduleEntry"][0]
+    second: Dict[str, Any] = result[1]["leaseschedule"]["scheduleEntry"][0]
+    assert first["propertyDescription"] == "Transformer Chamber (Ground Floor)"
+    assert first["propertyDescription"] is second["propertyDescription"]
+    assert first["dateOfLeaseAndTermAsReported"] is second["dateOfLeaseAndTermAsReported"]
@@ -0,0 +1,75 @@
+from typing import List, Dict, Any
+from processing.deduplication import (find_duplicate_entries, map_schedule_indexes, deduplicate_entries,
+                                      expand_deduplicated_entries)
+
+
+def make_entry(guid: str, entry_number: str, lessees_title: str) -> Dict[str, Any]:
+    """
+    Build a processed entry with the given identifiers and a shared lease term.
+    """
+    return {
+        "guid": guid,
+        "processedDateTime": "2024-09-11 19:47:27",
+        "entryNumber": entry_number,
+        "registrationDateAndPlanRef": "28.01.2009 tinted blue (part of)",
+        "propertyDescription": "Transformer Chamber (Ground Floor)",
+        "dateOfLeaseAndTermAsReported": "23.01.2009 125 years from 23.1.2009",
+        "lesseesTitle": lessees_title,
+        "noteOne": None,
+        "noteTwo": None,
+        "noteThree": None,
+        "noteFour": None
+    }
+
+
+def test_find_duplicate_entries_across_schedules() -> None:
+    """
+    Test that entries with identical content under different schedules are grouped with their locations.
+    """
+    sample_data: List[Dict[str, Any]] = [
+        {"leaseschedule": {"scheduleType": "Test", "scheduleEntry": [make_entry("a", "1", "EGL551039"),
+                                                                     make_entry("b", "2", "EGL557357")]}},
+        {"leaseschedule": {"scheduleType": "Test", "scheduleEntry": [make_entry("c", "1", "EGL551039")]}}
+    ]
+    entries: List[Dict[str, Any]] = [entry for item in sample_data for entry in item["leaseschedule"]["scheduleEntry"]]
+
+    result: List[List[Dict[str, Any]]] = find_duplicate_entries(entries, map_schedule_indexes(sample_data, entries))
+    assert result == [[{"scheduleIndex": 0, "entryNumber": "1", "guid": "a"},
+                       {"scheduleIndex": 1, "entryNumber": "1", "guid": "c"}]]
+
+
+def test_find_duplicate_entries_excludes_cancellation_stubs_and_empty_entries() -> None:
+    """
+    Test that repeated cancellation stubs and entries without content are not reported as duplicates.
+    """
+    cancelled: Dict[str, Any] = {**make_entry("a", "1", "EGL551039"), "propertyDescription": None,
+                                 "dateOfLeaseAndTermAsReported": None, "lesseesTitle": None,
+                                 "registrationDateAndPlanRef": "ITEM CANCELLED on 6 August 2019."}
+    empty: Dict[str, Any] = {**cancelled, "registrationDateAndPlanRef": None}
+    entries: List[Dict[str, Any]] = [cancelled, {**cancelled, "guid": "b"}, empty, {**empty, "guid": "d"}]
+
+    assert find_duplicate_entries(entries, [0, 0, 1, 1]) == []
+
+
+def test_deduplicate_entries_shares_values_and_contents() -> None:
+    """
+    Test that repeated values and identical contents are stored once and referenced by index.
+    """
+    entries: List[Dict[str, Any]] = [make_entry("a", "1", "EGL551039"), make_entry("b", "2", "EGL551039"),
+                                     make_entry("c", "3", "EGL557357")]
+
+    result: Dict[str, Any] = deduplicate_entries(entries)
+    assert len(result["contents"]) == 2
+    assert result["values"].count("2024-09-11 19:47:27") == 1
+    assert result["entries"][0]["content"] == result["entries"][1]["content"]
+    assert result["contents"][0][result["contentFields"].index("noteOne")] is None
+
+
+def test_expand_deduplicated_entries_round_trip() -> None:
+    """
+    Test that expanding deduplicated data restores the original entries.
+    """
+    entries: List[Dict[str, Any]] = [make_entry("a", "1", "EGL551039"), make_entry("b", "2", "EGL551039")]
+
+    assert expand_deduplicated_entries(deduplicate_entries(entries)) == entries
+
@@ -0,0 +1,198 @@
+import json
+import multiprocessing
+import os
+import time
+from typing import List, Dict, Any
+from processing.work_queue import (create_work_units, try_claim_unit, run_worker, merge_partial_outputs,
+                                   process_unit, lease_path, get_lease_attempts, is_unit_done, LeaseHeartbeat,
+                                   MANIFEST_FILE, UNITS_DIR)
+
+
+def make_data(schedule_count: int) -> List[Dict[str, Any]]:
+    """
+    Build input data with one valid entry per schedule.
+    """
+    return [
+        {
+            "leaseschedule": {
+                "scheduleType": "SCHEDULE OF NOTICES OF LEASE",
+                "scheduleEntry": [
+                    {
+                        "entryNumber": str(idx + 1),
+                        "entryText": [
+                            "28.01.2009      Transformer Chamber (Ground   23.01.2009      EGL551039  ",
+                            "tinted blue     Floor)                        99 years from              ",
+                            "(part of)                                     23.1.2009"
+                        ]
+                    }
+                ]
+            }
+        }
+        for idx in range(schedule_count)
+    ]
+
+
+def test_create_work_units_splits_schedules(tmp_path) -> None:
+    """
+    Test that the input is split into ranges of schedules and that an existing queue is not overwritten.
+    """
+    queue_dir: str = str(tmp_path)
+
+    assert create_work_units(make_data(5), queue_dir, 2) == ["unit-00000", "unit-00001", "unit-00002"]
+    assert create_work_units(make_data(5), queue_dir, 2) is None
+
+
+def test_try_claim_unit_is_exclusive(tmp_path) -> None:
+    """
+    Test that a unit held by a live lease cannot be claimed by a second worker.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+
+    assert try_claim_unit(queue_dir, "unit-00000", "w1", 60, 3) == 1
+    assert try_claim_unit(queue_dir, "unit-00000", "w2", 60, 3) is None
+
+
+def test_try_claim_unit_reclaims_expired_lease(tmp_path) -> None:
+    """
+    Test that a unit whose lease has not been renewed within the timeout is reclaimed with a new attempt.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+    try_claim_unit(queue_dir, "unit-00000", "dead-worker", 60, 3)
+    stale_time: float = time.time() - 120
+    os.utime(lease_path(queue_dir, "unit-00000", 1), (stale_time, stale_time))
+
+    assert try_claim_unit(queue_dir, "unit-00000", "w2", 60, 3) == 2
+
+
+def expire_lease(queue_dir: str, unit_id: str, attempt: int) -> None:
+    """
+    Backdate a lease file so it looks abandoned by its worker.
+    """
+    stale_time: float = time.time() - 120
+    os.utime(lease_path(queue_dir, unit_id, attempt), (stale_time, stale_time))
+
+
+def test_process_unit_discards_superseded_lease(tmp_path) -> None:
+    """
+    Test that a worker whose lease was reclaimed while processing discards its result.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+    try_claim_unit(queue_dir, "unit-00000", "slow-worker", 60, 3)
+    expire_lease(queue_dir, "unit-00000", 1)
+    assert try_claim_unit(queue_dir, "unit-00000", "w2", 60, 3) == 2
+
+    assert process_unit(queue_dir, "unit-00000", 1, 60) is False
+    assert not is_unit_done(queue_dir, "unit-00000")
+    assert process_unit(queue_dir, "unit-00000", 2, 60) is True
+
+
+def test_run_worker_exits_when_units_exhausted(tmp_path) -> None:
+    """
+    Test that a worker stops once every pending unit has expired on its final attempt.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+    for attempt in range(1, 3):
+        assert try_claim_unit(queue_dir, "unit-00000", f"dead-worker-{attempt}", 60, 2) == attempt
+        expire_lease(queue_dir, "unit-00000", attempt)
+
+    assert run_worker(queue_dir, "w1", lease_timeout=60, max_attempts=2, poll_interval=0) == (0, ["unit-00000"])
+    assert merge_partial_outputs(queue_dir) is None
+
+
+def test_run_worker_releases_lease_of_failed_unit(tmp_path) -> None:
+    """
+    Test that a failing unit is retried straight away rather than after the lease timeout.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+    with open(os.path.join(queue_dir, UNITS_DIR, "unit-00000.json"), 'w', encoding='utf-8') as file:
+        json.dump({"unitId": "unit-00000", "scheduleStart": 0, "scheduleEnd": 1, "data": None}, file)
+
+    started: float = time.time()
+    assert run_worker(queue_dir, "w1", lease_timeout=60, max_attempts=2, poll_interval=0) == (0, ["unit-00000"])
+    assert get_lease_attempts(queue_dir, "unit-00000") == [1, 2]
+    assert time.time() - started < 10
+
+
+def test_lease_heartbeat_renews_lease(tmp_path) -> None:
+    """
+    Test that the heartbeat keeps touching the lease while a unit is being processed.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(1), queue_dir, 1)
+    try_claim_unit(queue_dir, "unit-00000", "w1", 60, 3)
+    expire_lease(queue_dir, "unit-00000", 1)
+
+    with LeaseHeartbeat(queue_dir, "unit-00000", 1, 0.01):
+        time.sleep(0.1)
+    assert time.time() - os.path.getmtime(lease_path(queue_dir, "unit-00000", 1)) < 60
+
+
+def test_merge_partial_outputs_requires_manifest(tmp_path) -> None:
+    """
+    Test that merging is refused when the coordinator did not finish writing the queue.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(2), queue_dir, 1)
+    run_worker(queue_dir, "w1", poll_interval=0)
+    os.remove(os.path.join(queue_dir, MANIFEST_FILE))
+
+    assert merge_partial_outputs(queue_dir) is None
+
+
+def test_concurrent_workers_complete_each_unit_once(tmp_path) -> None:
+    """
+    Test that several worker processes sharing one directory complete every unit exactly once.
+    """
+    queue_dir: str = str(tmp_path)
+    unit_ids: List[str] = create_work_units(make_data(12), queue_dir, 1)
+
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=run_worker, args=(queue_dir, f"w{idx}"), kwargs={"poll_interval": 0.05})
+               for idx in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    assert all(get_lease_attempts(queue_dir, unit_id) == [1] for unit_id in unit_ids)
+    result, schedule_indexes = merge_partial_outputs(queue_dir)
+    assert [entry["entryNumber"] for entry in result] == [str(idx + 1) for idx in range(12)]
+    assert schedule_indexes == list(range(12))
+
+
+def test_merge_partial_outputs_requires_all_units(tmp_path) -> None:
+    """
+    Test that merging is refused until every unit is done, then returns the entries in unit order.
+    """
+    queue_dir: str = str(tmp_path)
+    create_work_units(make_data(3), queue_dir, 2)
+    assert merge_partial_outputs(queue_dir) is None
+
+    assert run_worker(queue_dir, "w1", poll_interval=0) == (2, [])
+    result, schedule_indexes = merge_partial_outputs(queue_dir)
+    assert [entry["entryNumber"] for entry in result] == ["1", "2", "3"]
+    assert schedule_indexes == [0, 1, 2]
+
+
+def test_worker_started_before_coordinator_waits_for_manifest(tmp_path) -> None:
+    """
+    Test that a worker started before the coordinator does not exit early on a partially written queue.
+    """
+    queue_dir: str = str(tmp_path)
+
+    context = multiprocessing.get_context('fork')
+    worker = context.Process(target=run_worker, args=(queue_dir, "early-worker"), kwargs={"poll_interval": 0.05})
+    worker.start()
+    time.sleep(0.2)
+    assert worker.is_alive()
+
+    create_work_units(make_data(3), queue_dir, 1)
+    worker.join(timeout=60)
+    assert worker.exitcode == 0
+    assert len(merge_partial_outputs(queue_dir)[0]) == 3